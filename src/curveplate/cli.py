@@ -118,8 +118,12 @@ def validate_args(args: argparse.Namespace) -> list[str]:
     elif template_type == "t":  # Transition
         if not args.radius:
             errors.append("Transition template requires --radius")
+        elif args.radius < 0:
+            errors.append("Transition template requires a positive --radius")
         if not args.length:
             errors.append("Transition template requires --length")
+        elif args.length < 0:
+            errors.append("Transition template requires a positive --length")
         if not args.left and not args.right:
             errors.append("Transition template requires --left or --right")
         if args.arc:
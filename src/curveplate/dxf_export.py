@@ -5,7 +5,7 @@ from pathlib import Path
 import ezdxf
 from ezdxf.enums import TextEntityAlignment
 
-from .geometry import Template, Point
+from .geometry import Template
 
 
 # ISO paper sizes in mm (width, height) - landscape orientation
@@ -92,7 +92,7 @@ def export_dxf(
     offset_y = (paper_h - template_h) / 2 - min_pt.y
 
     # Draw template outline as polyline
-    translated_points = [(p.x + offset_x, p.y + offset_y) for p in template.points]
+    translated_points = (template.points + (offset_x, offset_y)).tolist()
     msp.add_lwpolyline(translated_points, close=True, dxfattribs={"layer": "TEMPLATE"})
 
     # Add border and title block if requested
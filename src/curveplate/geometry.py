@@ -1,11 +1,19 @@
 """Geometry calculations for track templates."""
 
+import inspect
+import math
 from dataclasses import dataclass
+from functools import cached_property, lru_cache, wraps
 from typing import Literal
-import math
 
+import numpy as np
+
+# Scalar maths on a single Point uses the math module, which is several times
+# faster than NumPy on Python floats. NumPy is reserved for whole outlines held
+# as (N, 2) arrays, where its per-call overhead is amortised (see rotate_batch).
 
-@dataclass
+
+@dataclass(slots=True)
 class Point:
     """2D point."""
     x: float
@@ -19,37 +27,120 @@ class Point:
 
     def rotate(self, angle_rad: float, origin: "Point | None" = None) -> "Point":
         """Rotate point around origin by angle in radians."""
-        if origin is None:
-            origin = Point(0, 0)
-        dx = self.x - origin.x
-        dy = self.y - origin.y
+        ox, oy = (0.0, 0.0) if origin is None else (origin.x, origin.y)
+        dx = self.x - ox
+        dy = self.y - oy
         cos_a = math.cos(angle_rad)
         sin_a = math.sin(angle_rad)
         return Point(
-            origin.x + dx * cos_a - dy * sin_a,
-            origin.y + dx * sin_a + dy * cos_a,
+            ox + dx * cos_a - dy * sin_a,
+            oy + dx * sin_a + dy * cos_a,
         )
 
 
-@dataclass
+def rotate_batch(
+    points_xy: np.ndarray, angle_rad: float, origin: Point | None = None
+) -> np.ndarray:
+    """Rotate an (N, 2) array of x, y points around origin by angle in radians."""
+    cos_a = math.cos(angle_rad)
+    sin_a = math.sin(angle_rad)
+    rotation = np.array([[cos_a, -sin_a], [sin_a, cos_a]])
+    points_xy = np.asarray(points_xy, dtype=np.float64)
+    if origin is None:
+        return points_xy @ rotation.T
+    offset = np.array([origin.x, origin.y])
+    return (points_xy - offset) @ rotation.T + offset
+
+
+@dataclass(frozen=True, eq=False)
 class Template:
-    """Base template with geometry data."""
+    """Base template with geometry data.
+
+    Templates are immutable: the outline is stored as a read-only copy, so
+    its extents are computed on first use and cached, and the builders can
+    hand out the same instance for repeated identical requests.
+    """
     gauge: float
-    points: list[Point]  # Closed polygon outline
+    points: np.ndarray  # Closed polygon outline, (N, 2) float64 array of x, y
     template_type: Literal["straight", "curve", "transition"]
+    closed: bool = True  # Last point repeats the first to close the outline
+
+    def __post_init__(self) -> None:
+        points = np.array(self.points, dtype=np.float64)
+        points.flags.writeable = False
+        object.__setattr__(self, "points", points)
+
+    @cached_property
+    def _extents(self) -> tuple[float, float, float, float]:
+        """Min x, min y, max x and max y of the outline."""
+        min_x, min_y = self.points.min(axis=0).tolist()
+        max_x, max_y = self.points.max(axis=0).tolist()
+        return min_x, min_y, max_x, max_y
 
     def bounding_box(self) -> tuple[Point, Point]:
         """Return min and max corners of bounding box."""
-        xs = [p.x for p in self.points]
-        ys = [p.y for p in self.points]
-        return Point(min(xs), min(ys)), Point(max(xs), max(ys))
+        min_x, min_y, max_x, max_y = self._extents
+        return Point(min_x, min_y), Point(max_x, max_y)
 
     def dimensions(self) -> tuple[float, float]:
         """Return width and height of template."""
-        min_pt, max_pt = self.bounding_box()
-        return max_pt.x - min_pt.x, max_pt.y - min_pt.y
+        min_x, min_y, max_x, max_y = self._extents
+        return max_x - min_x, max_y - min_y
+
+
+def _memoized(func):
+    """Cache a template builder on its fully bound arguments.
+
+    Positional and keyword spellings of the same call share one cache entry,
+    and float parameters are converted to float first so that 9 and 9.0
+    build the same Template rather than whichever was requested first.
+    """
+    signature = inspect.signature(func)
+    float_params = {
+        name
+        for name, param in signature.parameters.items()
+        if param.annotation in (float, float | None)
+    }
+    cached = lru_cache(maxsize=128)(func)
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        for name in float_params:
+            if bound.arguments[name] is not None:
+                bound.arguments[name] = float(bound.arguments[name])
+        return cached(*bound.args)
+
+    wrapper.cache_info = cached.cache_info
+    wrapper.cache_clear = cached.cache_clear
+    return wrapper
+
+
+def _direction_sign(direction: Literal["left", "right"]) -> float:
+    """Return the y-axis sign for a curve direction (1.0 right, -1.0 left)."""
+    if direction == "right":
+        return 1.0
+    if direction == "left":
+        return -1.0
+    raise ValueError(f"direction must be 'left' or 'right', got {direction!r}")
+
+
+def _outline_buffer(num_points: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Allocate a closed outline for two rails of num_points each.
+
+    The outline runs inner rail start to end, outer rail end to start, then
+    back to the inner start. Returns it with views of the inner and outer
+    rails in start-to-end order, so builders can write both rails in place;
+    the closing point is left for the caller to set.
+    """
+    points = np.empty((2 * num_points + 1, 2))
+    inner = points[:num_points]
+    outer = points[2 * num_points - 1 : num_points - 1 : -1]
+    return points, inner, outer
 
 
+@_memoized
 def create_straight_template(gauge: float, length: float) -> Template:
     """Create a straight track template (rectangle).
 
@@ -61,16 +152,20 @@ def create_straight_template(gauge: float, length: float) -> Template:
         Template with rectangular outline
     """
     # Rectangle with inner rail at y=0, outer rail at y=gauge
-    points = [
-        Point(0, 0),
-        Point(length, 0),
-        Point(length, gauge),
-        Point(0, gauge),
-        Point(0, 0),  # Close the polygon
-    ]
-    return Template(gauge=gauge, points=points, template_type="straight")
-
-
+    points = np.array(
+        [
+            [0.0, 0.0],
+            [length, 0.0],
+            [length, gauge],
+            [0.0, gauge],
+            [0.0, 0.0],  # Close the polygon
+        ],
+        dtype=np.float64,
+    )
+    return Template(gauge=gauge, points=points, template_type="straight", closed=True)
+
+
+@_memoized
 def create_curve_template(
     gauge: float,
     radius: float,
@@ -100,76 +195,85 @@ def create_curve_template(
         angle_rad = length / radius
     else:
         raise ValueError("Must specify either arc_degrees or length")
-
-    # Inner arc points
-    inner_points = []
-    outer_points = []
-
-    for i in range(num_segments + 1):
-        t = i / num_segments
-        theta = t * angle_rad
-
-        # Inner rail arc
-        if direction == "right":
-            # Center is at (0, radius), curving clockwise
-            inner_x = radius * math.sin(theta)
-            inner_y = radius - radius * math.cos(theta)
-            outer_x = (radius + gauge) * math.sin(theta)
-            outer_y = radius - (radius + gauge) * math.cos(theta)
-        else:
-            # Center is at (0, -radius), curving counter-clockwise
-            inner_x = radius * math.sin(theta)
-            inner_y = -radius + radius * math.cos(theta)
-            outer_x = (radius + gauge) * math.sin(theta)
-            outer_y = -radius + (radius + gauge) * math.cos(theta)
-
-        inner_points.append(Point(inner_x, inner_y))
-        outer_points.append(Point(outer_x, outer_y))
+    if num_segments < 1:
+        raise ValueError("num_segments must be at least 1")
+
+    # Right curves have the centre at (0, radius) and curve clockwise; left
+    # curves mirror this about the x axis with the centre at (0, -radius).
+    sign = _direction_sign(direction)
+
+    # Each arc point is the previous one rotated by a fixed step, so build the
+    # unit vectors with the angle-addition recurrence (a running complex
+    # product) from a single sin/cos of the step angle
+    step = angle_rad / num_segments
+    rotations = np.empty(num_segments + 1, dtype=np.complex128)
+    rotations[0] = 1.0
+    rotations[1:] = complex(math.cos(step), math.sin(step))
+    np.cumprod(rotations, out=rotations)
+    sin_t = rotations.imag
+    cos_t = rotations.real
 
     # Build closed polygon: inner arc -> end cap -> outer arc reversed -> start cap
-    points = inner_points.copy()
-    points.append(outer_points[-1])  # End cap (implicit line)
-    points.extend(reversed(outer_points[:-1]))
-    points.append(inner_points[0])  # Close polygon
+    points, inner, outer = _outline_buffer(num_segments + 1)
+
+    inner[:, 0] = radius * sin_t
+    inner[:, 1] = sign * (radius * (1.0 - cos_t))
+    # The outer rail lies a further gauge along the same radius:
+    # (radius + gauge) * sin = inner_x + gauge * sin and
+    # radius - (radius + gauge) * cos = inner_y - gauge * cos
+    outer[:, 0] = inner[:, 0] + gauge * sin_t
+    outer[:, 1] = inner[:, 1] - sign * gauge * cos_t
 
-    return Template(gauge=gauge, points=points, template_type="curve")
+    points[-1] = inner[0]
 
+    return Template(gauge=gauge, points=points, template_type="curve", closed=True)
 
-def _integrate_clothoid(A_squared: float, length: float, num_segments: int) -> tuple[list[Point], list[float]]:
-    """Integrate a clothoid curve numerically.
+
+def _integrate_clothoid(
+    length: float,
+    A_squared: float,
+    num_segments: int,
+    gauge: float,
+    sign: float,
+    inner: np.ndarray,
+    outer: np.ndarray,
+) -> None:
+    """Integrate a clothoid inner rail and its perpendicular outer rail.
 
     Args:
-        A_squared: Clothoid parameter squared (A² = R * L)
         length: Total arc length
+        A_squared: Clothoid parameter squared (A² = R * L)
         num_segments: Number of segments
-
-    Returns:
-        Tuple of (points, tangent_angles) along the curve
+        gauge: Offset from inner to outer rail
+        sign: 1.0 for a right-hand curve, -1.0 to mirror it for a left-hand curve
+        inner: (N, 2) output array for inner rail x, y
+        outer: (N, 2) output array for outer rail x, y
     """
-    points = []
-    angles = []
-
-    x, y = 0.0, 0.0
-    theta = 0.0
+    ds = length / num_segments
 
-    for i in range(num_segments + 1):
-        s = (i / num_segments) * length
-        points.append(Point(x, y))
-        angles.append(theta)
+    # Curvature κ(s) = s / A² grows linearly, so the tangent angle after i
+    # Euler steps has the closed form θ_i = Σ_{j<i} κ(j·ds)·ds = ds²/A² · i(i-1)/2.
+    # That leaves no serial dependency on θ; only the positions are a running
+    # sum of the forward steps.
+    i = np.arange(num_segments + 1).astype(np.float64)
+    theta = (ds * ds / A_squared) * (0.5 * i * (i - 1.0))
 
-        if i < num_segments:
-            ds = length / num_segments
-            # Curvature κ(s) = s / A² for a clothoid
-            kappa = s / A_squared if s > 0 else 0
+    # The normal offset and the forward step share the same tangent angle
+    sin_t = np.sin(theta)
+    cos_t = np.cos(theta)
 
-            # Update position and angle
-            x += ds * math.cos(theta)
-            y += ds * math.sin(theta)
-            theta += kappa * ds
+    inner[0, 0] = 0.0
+    inner[0, 1] = 0.0
+    inner[1:, 0] = np.cumsum(ds * cos_t[:-1])
+    inner[1:, 1] = sign * np.cumsum(ds * sin_t[:-1])
 
-    return points, angles
+    # Outer rail: offset along the normal, which points left of the
+    # tangent for a right-hand curve and right of it when mirrored
+    outer[:, 0] = inner[:, 0] - sign * gauge * sin_t
+    outer[:, 1] = inner[:, 1] + gauge * cos_t
 
 
+@_memoized
 def create_transition_template(
     gauge: float,
     end_radius: float,
@@ -194,43 +298,25 @@ def create_transition_template(
     Returns:
         Template with transition curve outline
     """
+    if num_segments < 1:
+        raise ValueError("num_segments must be at least 1")
+    if length <= 0:
+        raise ValueError("length must be positive")
+    if end_radius <= 0:
+        raise ValueError("end_radius must be positive")
+
     # Clothoid parameter: A² = R * L
     A_squared = end_radius * length
 
-    # Generate inner rail clothoid
-    inner_points_raw, tangent_angles = _integrate_clothoid(A_squared, length, num_segments)
-
-    # Apply direction and calculate outer rail as perpendicular offset
-    inner_points = []
-    outer_points = []
-
-    for i, (p, theta) in enumerate(zip(inner_points_raw, tangent_angles)):
-        if direction == "right":
-            # Inner rail
-            inner_points.append(Point(p.x, p.y))
-            # Outer rail: offset perpendicular (normal points left of tangent)
-            nx, ny = -math.sin(theta), math.cos(theta)
-            outer_points.append(Point(p.x + gauge * nx, p.y + gauge * ny))
-        else:
-            # Mirror for left direction
-            inner_points.append(Point(p.x, -p.y))
-            # Outer rail: offset perpendicular (normal points right of tangent)
-            nx, ny = math.sin(theta), math.cos(theta)
-            outer_points.append(Point(p.x + gauge * nx, -p.y + gauge * ny))
-
-    # Build closed polygon with perpendicular end caps
-    points = []
-
-    # Inner rail from start to end
-    points.extend(inner_points)
-
-    # End cap: from inner end to outer end (perpendicular to tangent)
-    points.append(outer_points[-1])
+    # Build closed polygon with perpendicular end caps: inner rail from start
+    # to end, end cap to the outer end, outer rail reversed, then start cap
+    # back to the inner start
+    points, inner, outer = _outline_buffer(num_segments + 1)
 
-    # Outer rail from end to start (reversed)
-    points.extend(reversed(outer_points[:-1]))
+    # Generate inner rail clothoid and outer rail as perpendicular offset
+    sign = _direction_sign(direction)
+    _integrate_clothoid(length, A_squared, num_segments, gauge, sign, inner, outer)
 
-    # Start cap: close back to inner start (perpendicular to start tangent)
-    points.append(inner_points[0])
+    points[-1] = inner[0]
 
-    return Template(gauge=gauge, points=points, template_type="transition")
+    return Template(gauge=gauge, points=points, template_type="transition", closed=True)
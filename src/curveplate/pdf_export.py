@@ -1,6 +1,6 @@
 """PDF file export for track templates."""
 
-from datetime import datetime
+from datetime import date
 from pathlib import Path
 
 from reportlab.lib.units import mm
@@ -41,6 +41,7 @@ def export_pdf(
     paper_size: str | None = None,
     add_border: bool = False,
     title: str | None = None,
+    date_str: str | None = None,
 ) -> Path:
     """Export template to PDF file.
 
@@ -50,6 +51,7 @@ def export_pdf(
         paper_size: ISO paper size (a0-a4) or None for auto-select
         add_border: Whether to add title block and border
         title: Title for title block
+        date_str: Date shown in title block (YYYY-MM-DD), or None for today
 
     Returns:
         Path to created PDF file
@@ -79,12 +81,14 @@ def export_pdf(
     c.setStrokeColorRGB(0, 0, 0)
     c.setLineWidth(0.5)
 
+    page_points = ((template.points + (offset_x, offset_y)) * mm).tolist()
+
     path = c.beginPath()
-    first_point = template.points[0]
-    path.moveTo((first_point.x + offset_x) * mm, (first_point.y + offset_y) * mm)
+    first_x, first_y = page_points[0]
+    path.moveTo(first_x, first_y)
 
-    for point in template.points[1:]:
-        path.lineTo((point.x + offset_x) * mm, (point.y + offset_y) * mm)
+    for x, y in page_points[1:]:
+        path.lineTo(x, y)
 
     path.close()
     c.drawPath(path, stroke=1, fill=0)
@@ -101,6 +105,7 @@ def export_pdf(
             title=title or "Track Template",
             gauge=template.gauge,
             template_type=template.template_type,
+            date_str=date_str if date_str is not None else date.today().isoformat(),
         )
 
     c.save()
@@ -127,6 +132,7 @@ def _draw_title_block(
     title: str,
     gauge: float,
     template_type: str,
+    date_str: str,
 ) -> None:
     """Draw title block in bottom-right corner."""
     block_w = 100.0
@@ -160,5 +166,4 @@ def _draw_title_block(
 
     # Date
     c.setFont("Helvetica", 6)
-    date_str = datetime.now().strftime("%Y-%m-%d")
     c.drawString((x1 + 5) * mm, (y1 + 17) * mm, f"Date: {date_str}")
@@ -36,12 +36,10 @@ def export_stp(
         )
 
     # Extract polygon vertices (excluding closing point if present)
-    vertices = template.points
-    if len(vertices) > 1 and vertices[0].x == vertices[-1].x and vertices[0].y == vertices[-1].y:
-        vertices = vertices[:-1]
+    vertices = template.points[:-1] if template.closed else template.points
 
     # Convert to list of tuples for cadquery
-    points = [(p.x, p.y) for p in vertices]
+    points = [(x, y) for x, y in vertices.tolist()]
 
     # Create 2D profile using polyline
     # cadquery needs the points to form a closed wire
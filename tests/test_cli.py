@@ -92,6 +92,18 @@ class TestArgumentValidation:
         errors = validate_args(args)
         assert "Transition template requires --left or --right" in errors
 
+    def test_transition_requires_positive_radius(self):
+        parser = create_parser()
+        args = parser.parse_args(["-g", "9", "-t", "t", "-r", "-200", "-l", "150", "--left"])
+        errors = validate_args(args)
+        assert "Transition template requires a positive --radius" in errors
+
+    def test_transition_requires_positive_length(self):
+        parser = create_parser()
+        args = parser.parse_args(["-g", "9", "-t", "t", "-r", "200", "-l", "-150", "--left"])
+        errors = validate_args(args)
+        assert "Transition template requires a positive --length" in errors
+
     def test_valid_straight_template(self):
         parser = create_parser()
         args = parser.parse_args(["-g", "9", "-t", "s", "-l", "100"])
@@ -1,23 +1,38 @@
 """Tests for geometry module."""
 
+import dataclasses
 import math
 
+import numpy as np
 import pytest
 
 from curveplate.geometry import (
     Point,
+    Template,
+    rotate_batch,
     create_straight_template,
     create_curve_template,
     create_transition_template,
 )
 
 
+@pytest.fixture(autouse=True)
+def clear_template_caches():
+    """Keep tests independent of Templates cached by earlier tests."""
+    for builder in (create_straight_template, create_curve_template, create_transition_template):
+        builder.cache_clear()
+
+
 class TestPoint:
     def test_point_creation(self):
         p = Point(1.0, 2.0)
         assert p.x == 1.0
         assert p.y == 2.0
 
+    def test_point_has_no_instance_dict(self):
+        p = Point(1.0, 2.0)
+        assert not hasattr(p, "__dict__")
+
     def test_point_addition(self):
         p1 = Point(1.0, 2.0)
         p2 = Point(3.0, 4.0)
@@ -38,6 +53,61 @@ class TestPoint:
         assert abs(rotated.x) < 1e-10
         assert abs(rotated.y - 1.0) < 1e-10
 
+    def test_point_rotation_about_origin(self):
+        p = Point(2.0, 1.0)
+        rotated = p.rotate(math.pi, origin=Point(1.0, 1.0))
+        assert abs(rotated.x) < 1e-10
+        assert abs(rotated.y - 1.0) < 1e-10
+
+
+class TestRotateBatch:
+    def test_rotate_batch_matches_point_rotate(self):
+        points = np.array([[1.0, 0.0], [2.0, 1.0], [-3.0, 4.5]])
+        origin = Point(0.5, -1.0)
+        rotated = rotate_batch(points, 0.3, origin=origin)
+        for (x, y), (rx, ry) in zip(points, rotated, strict=True):
+            expected = Point(x, y).rotate(0.3, origin=origin)
+            assert abs(rx - expected.x) < 1e-10
+            assert abs(ry - expected.y) < 1e-10
+
+    def test_rotate_batch_about_zero(self):
+        rotated = rotate_batch(np.array([[1.0, 0.0]]), math.pi / 2)
+        assert np.allclose(rotated, [[0.0, 1.0]])
+
+
+class TestTemplate:
+    def test_template_is_immutable(self):
+        template = create_straight_template(gauge=9.0, length=100.0)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            template.gauge = 16.5
+        with pytest.raises(ValueError):
+            template.points[0, 0] = 1.0
+
+    def test_template_copies_caller_array(self):
+        points = np.array([[0.0, 0.0], [10.0, 0.0], [10.0, 5.0], [0.0, 0.0]])
+        template = Template(gauge=9.0, points=points, template_type="straight")
+        assert template.dimensions() == (10.0, 5.0)
+        assert points.flags.writeable
+        points[1, 0] = 50.0
+        assert template.points[1, 0] == 10.0
+        assert template.dimensions() == (10.0, 5.0)
+
+    def test_repeated_calls_share_template(self):
+        first = create_curve_template(9.0, 200.0, 45.0)
+        second = create_curve_template(gauge=9.0, radius=200.0, arc_degrees=45.0)
+        assert first is second
+
+    def test_integer_arguments_normalised_to_float(self):
+        create_straight_template(7, 123)
+        template = create_straight_template(7.0, 123.0)
+        assert isinstance(template.gauge, float)
+        assert str(template.gauge) == "7.0"
+
+    def test_different_parameters_build_new_template(self):
+        left = create_curve_template(gauge=9.0, radius=200.0, arc_degrees=45.0, direction="left")
+        right = create_curve_template(gauge=9.0, radius=200.0, arc_degrees=45.0)
+        assert left is not right
+
 
 class TestStraightTemplate:
     def test_straight_template_dimensions(self):
@@ -53,14 +123,21 @@ class TestStraightTemplate:
     def test_straight_template_closed_polygon(self):
         template = create_straight_template(gauge=9.0, length=100.0)
         # Polygon should be closed (first point == last point)
-        assert template.points[0].x == template.points[-1].x
-        assert template.points[0].y == template.points[-1].y
+        assert template.points[0, 0] == template.points[-1, 0]
+        assert template.points[0, 1] == template.points[-1, 1]
+        assert template.closed
 
     def test_straight_template_has_5_points(self):
         """4 corners + 1 closing point."""
         template = create_straight_template(gauge=9.0, length=100.0)
         assert len(template.points) == 5
 
+    def test_straight_template_points_array(self):
+        template = create_straight_template(gauge=9.0, length=100.0)
+        assert isinstance(template.points, np.ndarray)
+        assert template.points.shape == (5, 2)
+        assert template.points.dtype == np.float64
+
 
 class TestCurveTemplate:
     def test_curve_template_with_arc_degrees(self):
@@ -79,15 +156,48 @@ class TestCurveTemplate:
         template = create_curve_template(gauge=9.0, radius=200.0, arc_degrees=90.0)
         first = template.points[0]
         last = template.points[-1]
-        assert abs(first.x - last.x) < 1e-6
-        assert abs(first.y - last.y) < 1e-6
+        assert abs(first[0] - last[0]) < 1e-6
+        assert abs(first[1] - last[1]) < 1e-6
+        assert template.closed
 
     def test_curve_left_vs_right(self):
         left = create_curve_template(gauge=9.0, radius=200.0, arc_degrees=45.0, direction="left")
         right = create_curve_template(gauge=9.0, radius=200.0, arc_degrees=45.0, direction="right")
         # The templates should be mirror images
         # Just check they're different
-        assert left.points[1].y != right.points[1].y
+        assert left.points[1, 1] != right.points[1, 1]
+
+    def test_curve_template_requires_segments(self):
+        with pytest.raises(ValueError):
+            create_curve_template(gauge=9.0, radius=200.0, arc_degrees=45.0, num_segments=0)
+
+    def test_curve_template_rejects_unknown_direction(self):
+        with pytest.raises(ValueError):
+            create_curve_template(gauge=9.0, radius=200.0, arc_degrees=45.0, direction="up")
+
+    def test_curve_template_bounding_box(self):
+        template = create_curve_template(gauge=9.0, radius=200.0, arc_degrees=90.0)
+        min_pt, max_pt = template.bounding_box()
+        assert abs(min_pt.x) < 1e-10
+        assert abs(min_pt.y + 9.0) < 1e-10
+        assert abs(max_pt.x - 209.0) < 1e-10
+        assert abs(max_pt.y - 200.0) < 1e-10
+        assert template.dimensions() == (max_pt.x - min_pt.x, max_pt.y - min_pt.y)
+
+    def test_curve_template_matches_exact_arc(self):
+        n = 4096
+        template = create_curve_template(
+            gauge=9.0, radius=1000.0, arc_degrees=270.0, num_segments=n
+        )
+        theta = np.linspace(0.0, math.radians(270.0), n + 1)
+        inner = template.points[: n + 1]
+        assert np.allclose(inner[:, 0], 1000.0 * np.sin(theta), rtol=0, atol=1e-9)
+        assert np.allclose(inner[:, 1], 1000.0 * (1 - np.cos(theta)), rtol=0, atol=1e-9)
+
+    def test_curve_template_points_array(self):
+        template = create_curve_template(gauge=9.0, radius=200.0, arc_degrees=45.0)
+        # Inner arc, outer arc and closing point for 64 segments
+        assert template.points.shape == (2 * 65 + 1, 2)
 
 
 class TestTransitionTemplate:
@@ -103,8 +213,9 @@ class TestTransitionTemplate:
         )
         first = template.points[0]
         last = template.points[-1]
-        assert abs(first.x - last.x) < 1e-6
-        assert abs(first.y - last.y) < 1e-6
+        assert abs(first[0] - last[0]) < 1e-6
+        assert abs(first[1] - last[1]) < 1e-6
+        assert template.closed
 
     def test_transition_starts_straight(self):
         """The beginning of a transition should be essentially straight."""
@@ -112,5 +223,46 @@ class TestTransitionTemplate:
             gauge=9.0, end_radius=200.0, length=100.0, direction="right"
         )
         # First few points should have y close to 0 (straight)
-        assert abs(template.points[0].y) < 1e-6
-        assert abs(template.points[1].y) < 0.5  # Nearly straight at start
+        assert abs(template.points[0, 1]) < 1e-6
+        assert abs(template.points[1, 1]) < 0.5  # Nearly straight at start
+
+    def test_transition_template_requires_segments(self):
+        with pytest.raises(ValueError):
+            create_transition_template(
+                gauge=9.0, end_radius=200.0, length=100.0, num_segments=0
+            )
+
+    def test_transition_template_requires_positive_length(self):
+        with pytest.raises(ValueError):
+            create_transition_template(gauge=9.0, end_radius=200.0, length=0.0)
+
+    def test_transition_template_requires_positive_end_radius(self):
+        with pytest.raises(ValueError):
+            create_transition_template(gauge=9.0, end_radius=0.0, length=100.0)
+
+    def test_transition_template_rejects_unknown_direction(self):
+        with pytest.raises(ValueError):
+            create_transition_template(
+                gauge=9.0, end_radius=200.0, length=100.0, direction="up"
+            )
+
+    def test_transition_constant_gauge(self):
+        """Outer rail is offset perpendicular by exactly the gauge."""
+        n = 64
+        template = create_transition_template(
+            gauge=9.0, end_radius=200.0, length=150.0, direction="right", num_segments=n
+        )
+        inner = template.points[: n + 1]
+        outer = template.points[2 * n + 1 : n : -1]
+        assert np.allclose(np.hypot(*(outer - inner).T), 9.0)
+
+    def test_transition_left_mirrors_inner_rail(self):
+        n = 64
+        left = create_transition_template(
+            gauge=9.0, end_radius=200.0, length=150.0, direction="left", num_segments=n
+        )
+        right = create_transition_template(
+            gauge=9.0, end_radius=200.0, length=150.0, direction="right", num_segments=n
+        )
+        assert np.allclose(left.points[: n + 1, 0], right.points[: n + 1, 0])
+        assert np.allclose(left.points[: n + 1, 1], -right.points[: n + 1, 1])
@@ -0,0 +1,36 @@
+"""Tests for PDF export module."""
+
+import tempfile
+from datetime import date
+from pathlib import Path
+
+from curveplate import pdf_export
+from curveplate.geometry import create_straight_template
+
+
+class TestPdfExport:
+    def _capture_title_block(self, monkeypatch):
+        calls = []
+        monkeypatch.setattr(pdf_export, "_draw_title_block", lambda *a, **kw: calls.append(kw))
+        return calls
+
+    def test_title_block_uses_given_date(self, monkeypatch):
+        calls = self._capture_title_block(monkeypatch)
+        template = create_straight_template(gauge=9.0, length=100.0)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            pdf_export.export_pdf(
+                template, Path(tmpdir) / "dated", add_border=True, date_str="2020-01-01"
+            )
+
+        assert len(calls) == 1
+        assert calls[0]["date_str"] == "2020-01-01"
+
+    def test_title_block_defaults_to_today(self, monkeypatch):
+        calls = self._capture_title_block(monkeypatch)
+        template = create_straight_template(gauge=9.0, length=100.0)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            pdf_export.export_pdf(template, Path(tmpdir) / "undated", add_border=True)
+
+        assert calls[0]["date_str"] == date.today().isoformat()